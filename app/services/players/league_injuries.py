@@ -1,15 +1,164 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from calendar import isleap
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from urllib.parse import urlsplit, urlunsplit
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from typing import Dict, List, NamedTuple, Optional, Tuple
 import re
+import threading
+import time
 import unicodedata
 
+from bs4 import BeautifulSoup
+from lxml import etree
+from requests import Response
+
 from app.services.base import TransfermarktBase
 from app.utils.utils import extract_from_url, trim
 
+_WS_RE = re.compile(r"\s+")
+_PUNCT_RE = re.compile(r"[^\w ]+")
+_RE_DIGITS = re.compile(r"\d+")
+
+# Date shapes accepted by _normalize_date
+_RE_DOT = re.compile(r"^(\d{1,2})\.(\d{1,2})\.(\d{4})$")
+_RE_SLASH = re.compile(r"^(\d{1,2})/(\d{1,2})/(\d{2,4})$")
+_RE_WEEKDAY = re.compile(r"^[A-Za-z]{3},\s*")
+_MONTHS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+}
+_DAYS_IN_MONTH = {1: 31, 2: 28, 3: 31, 4: 30, 5: 31, 6: 30, 7: 31, 8: 31, 9: 30, 10: 31, 11: 30, 12: 31}
+
+# Known header variants (EN/DE) -> canonical column keys
+_VARIANTS = {
+    "player": {"player", "spieler"},
+    "club": {"club", "verein", "team", "mannschaft"},
+    "injury": {"injury", "verletzung"},
+    "since": {"since", "seit", "from", "injury since", "date of injury", "out since"},
+    "until": {"until", "bis", "to", "return date", "back on", "out until"},
+    "expectedreturn": {"expected return", "erwartete rückkehr", "voraussichtliche rückkehr", "expected back"},
+    "daysabsent": {"days", "tage", "fehltage"},
+    "gamesmissed": {"games missed", "spiele verpasst", "spiele"},
+    "notes": {"note", "notes", "bemerkung", "anmerkung"},
+    "position": {"position", "pos."},
+}
+# Reverse lookup {normalized header: canonical key}, built once
+_HEADER_CANON = {alt: key for key, alts in _VARIANTS.items() for alt in alts}
+
+# Document-wide expressions, evaluated through the XPathEvaluator bound to the page.
+_DOC_TABLE = "//table[(contains(@class,'items') or contains(@class,'responsive')) and .//thead//th]"
+_DOC_TABLE_ANY = "//table[.//thead//th]"
+_DOC_CANONICAL = "//link[@rel='canonical']/@href | //meta[@property='og:url']/@content"
+_DOC_H1 = "//h1//text()"
+_DOC_CRUMB = "//nav//ol//li[last()]//a//text() | //nav//ol//li[last()]//text()"
+_DOC_TITLE = "//title//text()"
+
+# Pages larger than this are parsed row by row instead of as a full DOM
+_STREAMING_THRESHOLD_BYTES = 1024 * 1024
+_STREAMING_CHUNK_BYTES = 64 * 1024
+_STREAMING_TAGS = ("link", "meta", "h1", "nav", "title", "tr")
+_RE_CHARSET = re.compile(r"charset\s*=\s*[\"']?([^\s;\"']+)", re.IGNORECASE)
+
+# Parsed results, keyed by URL, shared across requests for _CACHE_TTL_SECONDS.
+# Entries are immutable InjuriesResult tuples; every hit renders fresh dicts from them.
+_CACHE_TTL_SECONDS = 900
+_CACHE_MAXSIZE = 64
+_RESULTS_CACHE: "OrderedDict[str, Tuple[float, InjuriesResult]]" = OrderedDict()
+_RESULTS_CACHE_LOCK = threading.Lock()
+
+
+def _cache_get(key: str) -> Optional[InjuriesResult]:
+    """
+    Return the cached result for `key`, or None if it is missing or older than the TTL.
+    """
+    with _RESULTS_CACHE_LOCK:
+        entry = _RESULTS_CACHE.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if time.monotonic() - stored_at > _CACHE_TTL_SECONDS:
+            del _RESULTS_CACHE[key]
+            return None
+        _RESULTS_CACHE.move_to_end(key)
+        return value
+
+
+def _cache_put(key: str, value: InjuriesResult) -> None:
+    """
+    Store `value` under `key`, evicting the least recently used entries beyond _CACHE_MAXSIZE.
+    """
+    with _RESULTS_CACHE_LOCK:
+        _RESULTS_CACHE[key] = (time.monotonic(), value)
+        _RESULTS_CACHE.move_to_end(key)
+        while len(_RESULTS_CACHE) > _CACHE_MAXSIZE:
+            _RESULTS_CACHE.popitem(last=False)
+
+
+def _text(el) -> str:
+    """Descendant text of `el`, text nodes joined by a space (same as ' '.join(el.xpath('.//text()')))."""
+    return " ".join(el.itertext())
+
+
+_PLAYER_A = ".//a[contains(@class,'spielprofil') or contains(@href,'profil/spieler')]"
+
+# Element-relative expressions compiled once at import time and reused for every table/row.
+# smart_strings=False returns plain str results instead of "smart" strings that keep a
+# reference back to their parent element; nothing here calls getparent() on a result.
+_XP_THEAD_TH = etree.XPath(".//thead//th", smart_strings=False)
+_XP_TBODY_TR = etree.XPath(".//tbody/tr[td]", smart_strings=False)
+_XP_TDS = etree.XPath("./td", smart_strings=False)
+_XP_CELL_TITLE = etree.XPath(".//a/@title | .//img/@alt", smart_strings=False)
+_XP_PLAYER_A = etree.XPath(_PLAYER_A, smart_strings=False)
+_XP_INJURY_TD = etree.XPath(".//td[contains(@class,'links')][1]", smart_strings=False)
+# Same text nodes as _DOC_CRUMB, relative to one <nav> (used by the streaming parser)
+_XP_NAV_CRUMB = etree.XPath(".//ol//li[last()]//text()", smart_strings=False)
+
+
+class InjuryRow(NamedTuple):
+    """One parsed injuries table row, kept flat until it is rendered into the response."""
+
+    pid: Optional[str]
+    pname: str
+    purl: Optional[str]
+    cid: Optional[str]
+    cname: Optional[str]
+    curl: Optional[str]
+    injury: str
+    since: Optional[str]
+    until: Optional[str]
+
+
+class InjuriesResult(NamedTuple):
+    """Everything get_injuries renders for one league page; immutable, so it can be cached as is."""
+
+    league_name: Optional[str]
+    league_url: str
+    updated_at: str
+    rows: Tuple[InjuryRow, ...]
+
+
+def _row_to_dict(row: InjuryRow) -> dict:
+    """
+    Render an InjuryRow into the nested player/club dict returned by the API.
+    """
+    return {
+        "player": {
+            "id": row.pid,
+            "name": row.pname,
+            "url": row.purl,
+            "club": {
+                "id": row.cid,
+                "name": row.cname,
+            } if row.cname or row.curl else None,
+        },
+        "injury": row.injury,
+        "since": row.since,
+        "until": row.until,
+    }
+
 
 @dataclass
 class TransfermarktLeagueInjuries(TransfermarktBase):
@@ -18,6 +167,12 @@ class TransfermarktLeagueInjuries(TransfermarktBase):
     Example URL (more data): https://www.transfermarkt.com/championship/verletztespieler/wettbewerb/GB2/plus/1
     """
     URL: str
+    _eval: etree.XPathElementEvaluator = field(default=None, init=False, repr=False)
+    _cache_key: Optional[str] = field(default=None, init=False, repr=False)
+    _cached: Optional[InjuriesResult] = field(default=None, init=False, repr=False)
+    _streamed: Optional[Tuple[List[InjuryRow], Optional[str], Optional[str]]] = field(
+        default=None, init=False, repr=False,
+    )
     # season: Optional[str] = None
     # Future option: max_pages: int = 1
 
@@ -37,62 +192,168 @@ class TransfermarktLeagueInjuries(TransfermarktBase):
     def __post_init__(self) -> None:
         # Try the richer '/plus/1' version first; fallback to the original URL if needed
         primary = self._ensure_plus_variant(self.URL)
-        candidates = [primary] if primary == self.URL else [primary, self.URL]
-
-        last_error = None
-        for url in candidates:
-            self.URL = url
-            self.page = self.request_url_page()
-            # guard: table with headers exists
-            has_table = self.page.xpath(
-                "//table[(contains(@class,'items') or contains(@class,'responsive')) and .//thead//th]"
-            )
-            if has_table:
+
+        # A fresh cached result for this URL skips fetching and parsing altogether
+        self._cache_key = primary
+        self._cached = _cache_get(primary)
+        if self._cached is not None:
+            return
+
+        if primary == self.URL:
+            # Already the '/plus/' variant: a single fetch, nothing to fall back to
+            if self._load_page(primary):
+                return
+        else:
+            # The original URL is only fetched if the '/plus/1' page has no table
+            original = self.URL
+            if self._load_page(primary) or self._load_page(original):
                 return
-            last_error = "Injuries table not found"
 
-        # If neither candidate had a table, raise your standard guard error
+        # If no candidate had a table, raise your standard guard error
         self.raise_exception_if_not_found(xpath="//table")
-        # (Optionally: raise ValueError(last_error))
+
+    def _load_page(self, url: str) -> bool:
+        """
+        Fetch and parse `url` into self.page, binding the XPath evaluator to it.
+        Large pages are first parsed in streaming mode (see _get_injuries_streaming).
+        Returns whether the page holds an injuries table (with headers).
+        """
+        self.URL = url
+        response = self.make_request()
+        if len(response.content) > _STREAMING_THRESHOLD_BYTES:
+            self._streamed = self._get_injuries_streaming(response)
+            if self._streamed is not None:
+                return True
+        bsoup = BeautifulSoup(markup=response.content, features="html.parser")
+        self.page = self.convert_bsoup_to_page(bsoup=bsoup)
+        self._eval = etree.XPathEvaluator(self.page, smart_strings=False)
+        return bool(self._eval(_DOC_TABLE))
 
 
     # ---------- Public orchestrator ----------
     def get_injuries(self) -> dict:
-        table = self._get_injuries_table()
-        col_map = self._build_column_map(table)
-        rows = table.xpath(".//tbody/tr[td]")
-
-        items: List[dict] = []
-        for tr in rows:
-            parsed = self._parse_row(tr, col_map)
-            if parsed:
-                items.append(parsed)
-
-        league_name = self._guess_league_name()
-        canonical_url = self._canonical_url()
+        result = self._cached
+        if result is None:
+            if self._streamed is not None:
+                items, league_name, canonical_url = self._streamed
+            else:
+                table = self._get_injuries_table()
+                col_map = self._build_column_map(table)
+                rows = _XP_TBODY_TR(table)
+
+                items: List[InjuryRow] = []
+                for tr in rows:
+                    parsed = self._parse_row(tr, col_map)
+                    if parsed:
+                        items.append(parsed)
+
+                league_name = self._guess_league_name()
+                canonical_url = self._canonical_url()
+
+            result = InjuriesResult(
+                league_name=league_name,
+                league_url=canonical_url or self.URL,
+                updated_at=datetime.now(timezone.utc).isoformat(),
+                rows=tuple(items),
+            )
+            _cache_put(self._cache_key, result)
 
         self.response.update({
             "league": {
-                "name": league_name,
-                "url": canonical_url or self.URL,
+                "name": result.league_name,
+                "url": result.league_url,
                 # "season": self.season,
             },
-            "updatedAt": datetime.now(timezone.utc).isoformat(),
-            "rows": items,
+            "updatedAt": result.updated_at,
+            "rows": [_row_to_dict(row) for row in result.rows],
         })
         return self.response
 
     # ---------- Core parsing ----------
+    def _get_injuries_streaming(
+        self, response: Response,
+    ) -> Optional[Tuple[List[InjuryRow], Optional[str], Optional[str]]]:
+        """
+        Parse a large injuries page incrementally instead of holding its whole DOM.
+        The column map is built when the injuries table's header row closes; each body row
+        is parsed as soon as it closes and then freed, together with earlier siblings.
+        Returns (rows, league name, canonical url), or None if no injuries table was found.
+        """
+        # Only force the charset the server declared; otherwise libxml2 detects it from the
+        # page's <meta charset> (requests' ISO-8859-1 default for text/* would override it)
+        charset = _RE_CHARSET.search(response.headers.get("Content-Type") or "")
+        parser = etree.HTMLPullParser(
+            events=("end",), tag=_STREAMING_TAGS, encoding=charset.group(1) if charset else None,
+        )
+        content = response.content
+
+        table = None
+        col_map: Dict[str, int] = {}
+        items: List[InjuryRow] = []
+        # Text nodes behind _DOC_H1 / _DOC_CRUMB / _DOC_TITLE, so the league name matches the DOM path
+        h1: List[str] = []
+        crumb: List[str] = []
+        title: List[str] = []
+        canonical_url = None
+
+        def handle(elem) -> None:
+            """
+            Process one parsed element: injuries table rows, h1, breadcrumb nav, title, canonical link.
+            """
+            nonlocal table, col_map, canonical_url
+            if elem.tag == "tr":
+                parent = elem.getparent()
+                if parent is None:
+                    return
+                if parent.tag == "thead":
+                    candidate = parent.getparent()
+                    cls = (candidate.get("class") or "") if candidate is not None else ""
+                    # Like _DOC_TABLE, only a table whose header has <th> cells qualifies
+                    if table is None and ("items" in cls or "responsive" in cls) and elem.find("th") is not None:
+                        table = candidate
+                    if candidate is table:
+                        col_map = self._build_column_map(table)
+                elif parent.tag == "tbody" and table is not None and parent.getparent() is table:
+                    parsed = self._parse_row(elem, col_map)
+                    if parsed:
+                        items.append(parsed)
+                    # Free the processed row and everything before it
+                    elem.clear()
+                    while elem.getprevious() is not None:
+                        del parent[0]
+            elif elem.tag == "h1":
+                h1.extend(elem.itertext())
+            elif elem.tag == "nav":
+                # Nested <nav>s are covered by their outermost one
+                if next(elem.iterancestors("nav"), None) is None:
+                    crumb.extend(_XP_NAV_CRUMB(elem))
+            elif elem.tag == "title":
+                title.extend(elem.itertext())
+            elif canonical_url is None and (elem.get("rel") == "canonical" or elem.get("property") == "og:url"):
+                canonical_url = trim(elem.get("href") or elem.get("content") or "") or None
+
+        for start in range(0, len(content), _STREAMING_CHUNK_BYTES):
+            parser.feed(content[start:start + _STREAMING_CHUNK_BYTES])
+            for _, elem in parser.read_events():
+                handle(elem)
+        parser.close()
+        for _, elem in parser.read_events():
+            handle(elem)
+
+        if table is None:
+            return None
+        # Same precedence as _guess_league_name: h1, then breadcrumb, then title
+        names = h1 or crumb or title
+        return items, trim(" ".join(names)) if names else None, canonical_url
+
     def _get_injuries_table(self):
         """
         Locate the injuries table in a tolerant way.
         """
-        candidates = self.page.xpath(
-            "//table[contains(@class,'items') or contains(@class,'responsive')][.//thead//th]"
-        )
+        candidates = self._eval(_DOC_TABLE)
         if not candidates:
             # Try a fallback if layout differs
-            candidates = self.page.xpath("//table[.//thead//th]")
+            candidates = self._eval(_DOC_TABLE_ANY)
         if not candidates:
             raise ValueError("Injuries table not found on the page.")
         return candidates[0]
@@ -102,32 +363,14 @@ class TransfermarktLeagueInjuries(TransfermarktBase):
         Build a map {canonical_key: 1-based column index} from the table header.
         Header text is normalized and matched against known variants (EN/DE and likely others).
         """
-        th_nodes = table.xpath(".//thead//th")
-        headers = [self._norm_text(" ".join(h.xpath(".//text()"))) for h in th_nodes]
-
-        # Known variants -> canonical keys
-        variants = {
-            "player": {"player", "spieler"},
-            "club": {"club", "verein", "team", "mannschaft"},
-            "injury": {"injury", "verletzung"},
-            "since": {"since", "seit", "from", "injury since", "date of injury", "out since"},
-            "until": {"until", "bis", "to", "return date", "back on", "out until"},
-            "expectedreturn": {"expected return", "erwartete rückkehr", "voraussichtliche rückkehr", "expected back"},
-            "daysabsent": {"days", "tage", "fehltage"},
-            "gamesmissed": {"games missed", "spiele verpasst", "spiele"},
-            "notes": {"note", "notes", "bemerkung", "anmerkung"},
-            "position": {"position", "pos."},
-        }
-
-        def canon(h: str) -> Optional[str]:
-            for key, alts in variants.items():
-                if h in alts:
-                    return key
-            return None
-
         col_map: Dict[str, int] = {}
-        for idx, raw in enumerate(headers, start=1):
-            key = canon(raw)
+        for idx, th in enumerate(_XP_THEAD_TH(table), start=1):
+            h = _text(th).strip()
+            # Plain ASCII headers ("Player", "Injury", ...) usually match as-is;
+            # only fall back to the full normalization when they don't
+            key = _HEADER_CANON.get(h.lower()) if h.isascii() else None
+            if key is None:
+                key = _HEADER_CANON.get(self._norm_text(h))
             if key:
                 col_map[key] = idx
 
@@ -138,69 +381,67 @@ class TransfermarktLeagueInjuries(TransfermarktBase):
 
         return col_map
 
-    def _parse_row(self, tr, col_map: Dict[str, int]) -> Optional[dict]:
-        tds = tr.xpath("./td")
+    def _parse_row(self, tr, col_map: Dict[str, int]) -> Optional[InjuryRow]:
+        tds = _XP_TDS(tr)
         if not tds:
             return None
 
-        def cell_text(col_key: str) -> Optional[str]:
-            idx = col_map.get(col_key)
-            if not idx or idx > len(tds):
-                return None
-            return trim(" ".join(tds[idx - 1].xpath(".//text()")))
+        # Single pass over the cells: (text, first link href) per <td>
+        cells: List[Tuple[str, Optional[str]]] = []
+        for td in tds:
+            a = td.find(".//a[@href]")
+            cells.append((trim(_text(td)), trim(a.get("href")) if a is not None else None))
 
-        def cell_link(col_key: str) -> Optional[str]:
+        def cell(col_key: str) -> Tuple[Optional[str], Optional[str]]:
+            """
+            Return (text, href) of the cell mapped to `col_key`, or (None, None) if it is absent.
+            """
             idx = col_map.get(col_key)
-            if not idx or idx > len(tds):
-                return None
-            hrefs = tds[idx - 1].xpath(".//a/@href")
-            return trim(hrefs[0]) if hrefs else None
+            if not idx or idx > len(cells):
+                return None, None
+            return cells[idx - 1]
 
         # --- Player (name/url/id)
         # Prefer explicit player column; if missing, try first <a> in row
-        player_name = cell_text("player")
-        player_url = cell_link("player")
+        player_name, player_url = cell("player")
         if not player_name or not player_url:
-            link = tr.xpath(".//a[contains(@class,'spielprofil') or contains(@href,'profil/spieler')]/@href")
-            if link:
-                player_url = trim(link[0])
-                player_name = trim(" ".join(tr.xpath(".//a[contains(@class,'spielprofil') or contains(@href,'profil/spieler')]//text()")))
+            anchors = _XP_PLAYER_A(tr)
+            # A 'spielprofil' anchor may carry no href; take the first one that has it
+            href = next((a.get("href") for a in anchors if a.get("href")), None)
+            if href:
+                player_url = trim(href)
+                # The first profile link is often the portrait; take the first one with text
+                player_name = next(filter(None, (trim(_text(a)) for a in anchors)), None)
 
         # --- Club (optional)
         club_name, club_url = None, None
         if "club" in col_map:
-            club_name = cell_text("club")
-            club_url = cell_link("club")
-            if not club_name:
-                idx = col_map["club"]
-                cell = tds[idx - 1]
+            club_name, club_url = cell("club")
+            if not club_name and col_map["club"] <= len(tds):
                 # try <a title> or <img alt>
-                t = cell.xpath(".//a/@title | .//img/@alt")
+                t = _XP_CELL_TITLE(tds[col_map["club"] - 1])
                 if t:
                     club_name = trim(t[0])
-                if not club_url:
-                    href = cell.xpath(".//a/@href")
-                    club_url = trim(href[0]) if href else None
 
         # --- Other fields
-        injury = cell_text("injury")
-        since = self._normalize_date(cell_text("since"))
-        until = self._normalize_date(cell_text("until"))
-        # expected = self._normalize_date(cell_text("expectedreturn"))
-        # days_absent = self._parse_int(cell_text("daysabsent"))
-        # games_missed = self._parse_int(cell_text("gamesmissed"))
-        # notes = cell_text("notes")
+        injury = cell("injury")[0]
+        since = self._normalize_date(cell("since")[0])
+        until = self._normalize_date(cell("until")[0])
+        # expected = self._normalize_date(cell("expectedreturn")[0])
+        # days_absent = self._parse_int(cell("daysabsent")[0])
+        # games_missed = self._parse_int(cell("gamesmissed")[0])
+        # notes = cell("notes")[0]
 
         if (since is None or until is None):
-            injury_td = tr.xpath(".//td[contains(@class,'links')][1]")
+            injury_td = _XP_INJURY_TD(tr)
             if injury_td:
                 # walk following siblings: since -> until -> (often) days/games
                 sibs = injury_td[0].itersiblings(tag="td")
                 try:
                     since_td = next(sibs)
                     until_td = next(sibs)
-                    s_text = trim(" ".join(since_td.xpath(".//text()")))
-                    u_text = trim(" ".join(until_td.xpath(".//text()")))
+                    s_text = trim(_text(since_td))
+                    u_text = trim(_text(until_td))
                     if since is None:
                         since = self._normalize_date(s_text)
                     if until is None:
@@ -212,43 +453,39 @@ class TransfermarktLeagueInjuries(TransfermarktBase):
         if not (player_name and injury):
             return None
 
-        return {
-            "player": {
-                "id": extract_from_url(player_url),
-                "name": player_name,
-                "url": player_url,
-                "club": {
-                    "id": extract_from_url(club_url),
-                    "name": club_name,
-                } if club_name or club_url else None,
-            },
-            "injury": injury,
-            "since": since,
-            "until": until,
-            # "expectedReturn": expected,
-            # "daysAbsent": days_absent,
-            # "gamesMissed": games_missed,
-            # "notes": notes,
-        }
+        return InjuryRow(
+            pid=extract_from_url(player_url),
+            pname=player_name,
+            purl=player_url,
+            cid=extract_from_url(club_url),
+            cname=club_name,
+            curl=club_url,
+            injury=injury,
+            since=since,
+            until=until,
+        )
 
     # ---------- Utilities ----------
     def _norm_text(self, s: Optional[str]) -> str:
         """
-        Lowercase, strip, collapse spaces/punct, remove accents.
+        Lowercase, strip, collapse spaces/punct, fold to ASCII (removes accents).
         """
         if not s:
             return ""
-        s = unicodedata.normalize("NFKD", s)
-        s = "".join(ch for ch in s if not unicodedata.combining(ch))
+        if not s.isascii():
+            # Quick Check first: skip the decomposition pass when already NFKD
+            if not unicodedata.is_normalized("NFKD", s):
+                s = unicodedata.normalize("NFKD", s)
+            s = s.encode("ascii", "ignore").decode("ascii")
         s = s.strip().lower()
-        s = re.sub(r"\s+", " ", s)
-        s = re.sub(r"[^\w ]+", "", s)
+        s = _WS_RE.sub(" ", s)
+        s = _PUNCT_RE.sub("", s)
         return s
 
     def _parse_int(self, s: Optional[str]) -> Optional[int]:
         if not s:
             return None
-        digits = re.findall(r"\d+", s)
+        digits = _RE_DIGITS.findall(s)
         return int(digits[0]) if digits else None
 
     def _normalize_date(self, s: Optional[str]) -> Optional[str]:
@@ -260,51 +497,61 @@ class TransfermarktLeagueInjuries(TransfermarktBase):
             return None
         s = s.strip()
 
-        # ISO already?
-        if re.match(r"^\d{4}-\d{2}-\d{2}$", s):
-            return s
-
-        # 11.10.2025 -> 2025-10-11
-        m = re.match(r"^(\d{1,2})\.(\d{1,2})\.(\d{4})$", s)
-        if m:
-            d, mo, y = m.groups()
-            return f"{y}-{int(mo):02d}-{int(d):02d}"
-
-        # 01/09/2025 or 1/9/25 -> 2025-09-01
-        m = re.match(r"^(\d{1,2})/(\d{1,2})/(\d{2,4})$", s)
-        if m:
-            d, mo, y = m.groups()
-            if len(y) == 2:
-                y = ("20" + y) if int(y) <= 69 else ("19" + y)
-            return f"{y}-{int(mo):02d}-{int(d):02d}"
-
-        # Oct 11, 2025
-        try:
-            from datetime import datetime as dt
-            return dt.strptime(s, "%b %d, %Y").strftime("%Y-%m-%d")
-        except Exception:
-            pass
-
-        # e.g. "Sat, Oct 11, 2025"
-        s2 = re.sub(r"^[A-Za-z]{3},\s*", "", s)
-        try:
-            from datetime import datetime as dt
-            return dt.strptime(s2, "%b %d, %Y").strftime("%Y-%m-%d")
-        except Exception:
-            return None
+        # Route on the first few characters; textual dates skip the numeric checks entirely
+        if not s[:1].isalpha():
+            # ISO already?
+            if len(s) == 10 and s[4] == "-" and s[7] == "-" and s.isascii() and (s[:4] + s[5:7] + s[8:]).isdigit():
+                return s
+
+            head = s[:3]
+            # 11.10.2025 -> 2025-10-11
+            if "." in head:
+                m = _RE_DOT.match(s)
+                if m:
+                    d, mo, y = m.groups()
+                    return f"{y}-{int(mo):02d}-{int(d):02d}"
+
+            # 01/09/2025 or 1/9/25 -> 2025-09-01
+            elif "/" in head:
+                m = _RE_SLASH.match(s)
+                if m:
+                    d, mo, y = m.groups()
+                    if len(y) == 2:
+                        y = ("20" + y) if int(y) <= 69 else ("19" + y)
+                    return f"{y}-{int(mo):02d}-{int(d):02d}"
+
+        # Oct 11, 2025 or e.g. "Sat, Oct 11, 2025"
+        parts = _RE_WEEKDAY.sub("", s).replace(",", "").split()
+        if len(parts) == 3:
+            mon, d, y = parts
+            mo = _MONTHS.get(mon.lower())
+            if (
+                mo
+                and d.isascii()
+                and d.isdigit()
+                and len(d) <= 2
+                and y.isascii()
+                and y.isdigit()
+                and len(y) == 4
+                and int(y) >= 1
+            ):
+                last_day = 29 if mo == 2 and isleap(int(y)) else _DAYS_IN_MONTH[mo]
+                if 1 <= int(d) <= last_day:
+                    return f"{y}-{mo:02d}-{int(d):02d}"
+        return None
 
     def _canonical_url(self) -> Optional[str]:
-        url = self.page.xpath("//link[@rel='canonical']/@href | //meta[@property='og:url']/@content")
+        url = self._eval(_DOC_CANONICAL)
         return trim(url[0]) if url else None
 
     def _guess_league_name(self) -> Optional[str]:
         # Try breadcrumb or H1
-        h1 = self.page.xpath("//h1//text()")
+        h1 = self._eval(_DOC_H1)
         if h1:
             return trim(" ".join(h1))
-        crumb = self.page.xpath("//nav//ol//li[last()]//a//text() | //nav//ol//li[last()]//text()")
+        crumb = self._eval(_DOC_CRUMB)
         if crumb:
             return trim(" ".join(crumb))
         # Fallback: title
-        t = self.page.xpath("//title//text()")
+        t = self._eval(_DOC_TITLE)
         return trim(" ".join(t)) if t else None
@@ -1,7 +1,10 @@
 from pymongo import MongoClient
 from bson import ObjectId
 from datetime import datetime
+import functools
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import argparse
 from dotenv import load_dotenv
@@ -13,28 +16,44 @@ MONGO_URI = os.getenv("MONGO_URI")
 DB_NAME = os.getenv("DB_NAME")
 COLLECTION_NAME = os.getenv("COLLECTION_NAME")
 
+# The script makes a single injuries POST per run; this session only adds retries on
+# transient failures (the injuries endpoint is safe to re-POST)
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 502, 503, 504],
+        allowed_methods=frozenset(["GET", "POST"]),
+        raise_on_status=False,
+    ),
+)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
 
-def convert_objectid_to_str(data):
+
+def json_default(value):
     """
-    Recursively converts all ObjectId and datetime fields in the dictionary to strings.
+    json.dump fallback for Mongo types: ObjectId -> str, datetime -> ISO string.
+    Only called for values json can't encode, so documents aren't walked in Python.
     """
-    if isinstance(data, dict):
-        return {key: convert_objectid_to_str(value) for key, value in data.items()}
-    elif isinstance(data, list):
-        return [convert_objectid_to_str(item) for item in data]
-    elif isinstance(data, ObjectId):
-        return str(data)
-    elif isinstance(data, datetime):
-        return data.isoformat()  # Convert datetime to ISO string
-    else:
-        return data
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+@functools.lru_cache(maxsize=1)
+def _get_collection():
+    """Create the MongoDB client once and reuse its collection for every lookup."""
+    client = MongoClient(MONGO_URI)
+    db = client[DB_NAME]
+    return db[COLLECTION_NAME]
 
 def fetch_player_from_db(player_name: str):
     """Fetch player data from MongoDB."""
     try:
-        client = MongoClient(MONGO_URI)
-        db = client[DB_NAME]
-        collection = db[COLLECTION_NAME]
+        collection = _get_collection()
 
         # Query MongoDB first by display_name
         player_data = collection.find_one({"display_name": player_name})
@@ -46,8 +65,7 @@ def fetch_player_from_db(player_name: str):
 
         if player_data:
             print(f"Found player: {player_name}")
-            # Convert ObjectId to string
-            return convert_objectid_to_str(player_data)
+            return player_data
         else:
             print(f"Player {player_name} not found in the database.")
             return None
@@ -61,7 +79,7 @@ def fetch_injury_data(url: str):
     payload = {"url": url}
 
     # Make a POST request to the FastAPI endpoint
-    response = requests.post(api_url, json=payload)
+    response = _SESSION.post(api_url, json=payload)
     
     if response.status_code == 200:
         print(f"Successfully fetched data for: {url}")
@@ -88,16 +106,12 @@ def main():
             player_data = fetch_player_from_db(player_name)
 
             if player_data:
-                # Convert any ObjectId or datetime fields to strings
-                player_data = convert_objectid_to_str(player_data)
-                player_info = convert_objectid_to_str(player_info)
-
                 # Merge player data and injury data
                 merged_data = {**player_data, **player_info}
                 
                 # Save the merged data to a JSON file (or print it for now)
                 with open(f"output/{player_name}_injury_data.json", "w") as outfile:
-                    json.dump(merged_data, outfile, indent=2)
+                    json.dump(merged_data, outfile, indent=2, default=json_default)
                 print(f"Saved injury data for {player_data['name']}.")
 
 
@@ -1,8 +1,8 @@
 from pymongo import MongoClient
-from bson import ObjectId
-from datetime import datetime
+import orjson
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import argparse
 from dotenv import load_dotenv
 import os
@@ -13,20 +13,34 @@ MONGO_URI = os.getenv("MONGO_URI")
 DB_NAME = os.getenv("DB_NAME")
 COLLECTION_NAME = os.getenv("COLLECTION_NAME")
 
-def convert_objectid_to_str(data):
+# The script makes a single injuries POST per run; this session only adds retries on
+# transient failures (the injuries endpoint is safe to re-POST)
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 502, 503, 504],
+        allowed_methods=frozenset(["GET", "POST"]),
+        raise_on_status=False,
+    ),
+)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+
+def ensure_indexes():
     """
-    Recursively converts all ObjectId and datetime fields in the dictionary to strings.
+    One-off setup (--ensure-indexes): index display_name and name so each $or branch
+    of the player lookup is index-backed. Needs createIndex privileges; no-op if they exist.
     """
-    if isinstance(data, dict):
-        return {key: convert_objectid_to_str(value) for key, value in data.items()}
-    elif isinstance(data, list):
-        return [convert_objectid_to_str(item) for item in data]
-    elif isinstance(data, ObjectId):
-        return str(data)
-    elif isinstance(data, datetime):
-        return data.isoformat()  # Convert datetime to ISO string
-    else:
-        return data
+    try:
+        client = MongoClient(MONGO_URI)
+        collection = client[DB_NAME][COLLECTION_NAME]
+        collection.create_index([("display_name", 1)])
+        collection.create_index([("name", 1)])
+        print("Ensured indexes on display_name and name.")
+    except Exception as e:
+        print(f"Could not create indexes, continuing without them: {e}")
 
 def fetch_players_from_db(player_names: list):
     """Fetch player data from MongoDB based on display_name or name."""
@@ -43,16 +57,17 @@ def fetch_players_from_db(player_names: list):
             ]
         }
 
-        players = collection.find(query)
-        
+        players = collection.find(query, batch_size=500)
+
         # Build a dictionary where both display_name and name can be used as keys
         player_data_dict = {}
-
         for player in players:
             # Use display_name as the primary key, and name as a fallback
-            player_data_dict[player["display_name"].strip()] = player
-            if player["name"].strip() != player["display_name"].strip():
-                player_data_dict[player["name"].strip()] = player
+            display_name = player["display_name"].strip()
+            name = player["name"].strip()
+            player_data_dict[display_name] = player
+            if name != display_name:
+                player_data_dict[name] = player
 
         return player_data_dict
     except Exception as e:
@@ -66,7 +81,7 @@ def fetch_injury_data(url: str):
     payload = {"url": url}
 
     # Make a POST request to the FastAPI endpoint
-    response = requests.post(api_url, json=payload)
+    response = _SESSION.post(api_url, json=payload)
     
     if response.status_code == 200:
         print(f"Successfully fetched data for: {url}")
@@ -79,8 +94,13 @@ def main():
     # Command-line argument parsing
     parser = argparse.ArgumentParser(description="Fetch injury data for a league.")
     parser.add_argument("url", type=str, help="URL of the league injuries page")
+    parser.add_argument("--ensure-indexes", action="store_true",
+                        help="Create the display_name/name indexes first (requires createIndex privileges).")
     args = parser.parse_args()
 
+    if args.ensure_indexes:
+        ensure_indexes()
+
     # Fetch injury data
     data = fetch_injury_data(args.url)
     
@@ -103,10 +123,6 @@ def main():
                 print(f"Player {player_name} not found in the database.")
                 continue  # Skip to the next player if not found
 
-            # Convert any ObjectId or datetime fields to strings
-            player_data = convert_objectid_to_str(player_data)
-            player_info = convert_objectid_to_str(player_info)
-
             # Merge player data and injury data
             merged_data = {**player_data, **player_info}
 
@@ -115,8 +131,13 @@ def main():
             print(f"Added injury data for {player_data['name']}.")
 
         # Save all merged data to a single JSON file
-        with open("output/all_injured_players_data_2.json", "w") as outfile:
-            json.dump(all_player_data, outfile, indent=2)
+        # (orjson encodes datetimes itself; default=str turns ObjectIds into plain strings)
+        with open("output/all_injured_players_data_2.json", "wb") as outfile:
+            outfile.write(orjson.dumps(
+                all_player_data,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            ))
         print(f"Saved all merged data to all_injured_players_data.json.")
 
 if __name__ == "__main__":
@@ -13,19 +13,23 @@ python fetch_players.py --csv files/players.csv \
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
 import csv
 import json
 import logging
 import os
 import sys
+import threading
 import time
 from dataclasses import dataclass, asdict
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
+import orjson
 import requests
 from requests import Session
+from requests.adapters import HTTPAdapter
 from urllib.parse import quote
 import random
 
@@ -73,8 +77,8 @@ def load_existing(output_path: Path) -> Dict[str, Any]:
 def save_json_atomic(data: Dict[str, Any], out_path: Path) -> None:
     out_path.parent.mkdir(parents=True, exist_ok=True)
     tmp_path = out_path.with_suffix(".tmp")
-    with open(tmp_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    with open(tmp_path, "wb") as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
     tmp_path.replace(out_path)
 
 def read_names_from_csv(csv_path: Path) -> List[str]:
@@ -163,6 +167,7 @@ def main():
     parser.add_argument("--base-url", default=DEFAULT_BASE_URL, help="Base URL of your FastAPI app.")
     parser.add_argument("--resume", action="store_true", help="Resume: skip players already saved successfully.")
     parser.add_argument("--sleep", type=float, default=0.0, help="Optional sleep seconds between requests.")
+    parser.add_argument("--workers", type=int, default=8, help="Number of names fetched concurrently.")
     args = parser.parse_args()
 
     csv_path = Path(args.csv)
@@ -197,52 +202,79 @@ def main():
 
     items: List[Dict[str, Any]] = existing_items if args.resume else []
 
+    # One pooled session shared by all worker threads
     session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(args.workers, 1))
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
 
     total_start = time.perf_counter()
     success_count = 0
     fail_count = 0
 
+    pending: List[str] = []
     for name in names:
         if args.resume and name in processed_success_names:
             logging.info(f"Skipping (resume): '{name}' already fetched successfully.")
             continue
+        pending.append(name)
 
-        rec = fetch_first_result(session, args.base_url, name)
-        # Log outcome
-        if rec.success:
-            success_count += 1
-            logging.info(f"OK: '{name}' in {rec.duration_sec:.3f}s → {rec.first_result.get('name') if rec.first_result else 'N/A'}")
-        else:
-            fail_count += 1
-            logging.error(f"FAIL: '{name}' in {rec.duration_sec:.3f}s → {rec.error}")
-
-        # Append to items (store clean structure)
-        items.append({
-            "query": rec.query,
-            "success": rec.success,
-            "statusCode": rec.status_code,
-            "durationSec": round(rec.duration_sec, 3),
-            "first_result": rec.first_result,  # keep API shape as-is
-            "error": rec.error,
-        })
-
-        # Optional pacing
+    # Optional pacing: --sleep is a global gap between request starts, shared by all workers
+    pace_lock = threading.Lock()
+    next_slot = time.monotonic()
+
+    def fetch(name: str) -> PlayerFetchRecord:
+        nonlocal next_slot
         if args.sleep > 0:
-            time.sleep(args.sleep)
-
-        # Periodically flush to disk to be safe
-        if len(items) % 20 == 0:
-            payload = {
-                "generatedAt": datetime.now(timezone.utc).isoformat(),
-                "baseUrl": args.base_url,
-                "totalPlayers": len(names),
-                "successCount": success_count,
-                "failCount": fail_count,
-                "items": items,
-            }
-            save_json_atomic(payload, output_path)
-            logging.info(f"Checkpoint saved → {output_path}")
+            with pace_lock:
+                now = time.monotonic()
+                slot = max(now, next_slot)
+                next_slot = slot + args.sleep
+            if slot > now:
+                time.sleep(slot - now)
+        return fetch_first_result(session, args.base_url, name)
+
+    # Requests run concurrently; results are collected here on the main thread,
+    # so counters, items and checkpoints need no locking. On Ctrl-C or an error the queued
+    # names are cancelled so the run stops at the last checkpoint, as --resume expects
+    ex = concurrent.futures.ThreadPoolExecutor(max_workers=max(args.workers, 1))
+    try:
+        futures = {ex.submit(fetch, name): name for name in pending}
+        for fut in concurrent.futures.as_completed(futures):
+            name = futures[fut]
+            rec = fut.result()
+            # Log outcome
+            if rec.success:
+                success_count += 1
+                logging.info(f"OK: '{name}' in {rec.duration_sec:.3f}s → {rec.first_result.get('name') if rec.first_result else 'N/A'}")
+            else:
+                fail_count += 1
+                logging.error(f"FAIL: '{name}' in {rec.duration_sec:.3f}s → {rec.error}")
+
+            # Append to items (store clean structure)
+            items.append({
+                "query": rec.query,
+                "success": rec.success,
+                "statusCode": rec.status_code,
+                "durationSec": round(rec.duration_sec, 3),
+                "first_result": rec.first_result,  # keep API shape as-is
+                "error": rec.error,
+            })
+
+            # Periodically flush to disk to be safe
+            if len(items) % 20 == 0:
+                payload = {
+                    "generatedAt": datetime.now(timezone.utc).isoformat(),
+                    "baseUrl": args.base_url,
+                    "totalPlayers": len(names),
+                    "successCount": success_count,
+                    "failCount": fail_count,
+                    "items": items,
+                }
+                save_json_atomic(payload, output_path)
+                logging.info(f"Checkpoint saved → {output_path}")
+    finally:
+        ex.shutdown(wait=False, cancel_futures=True)
 
     total_duration = time.perf_counter() - total_start
 
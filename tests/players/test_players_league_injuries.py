@@ -0,0 +1,272 @@
+import pytest
+import requests
+from fastapi import HTTPException
+
+from app.services.players import league_injuries
+from app.services.players.league_injuries import TransfermarktLeagueInjuries
+
+URL = "https://www.transfermarkt.com/bundesliga/verletztespieler/wettbewerb/L1"
+URL_PLUS = URL + "/plus/1"
+
+ROW = (
+    '<tr class="odd"><td class="zentriert">{i}</td>'
+    '<td><table class="inline-table"><tr>'
+    '<td rowspan="2"><a href="/p/profil/spieler/{i}"><img alt="{name}" src="p.png"/></a></td>'
+    '<td class="hauptlink"><a class="spielprofil_tooltip" href="/p/profil/spieler/{i}">{name}</a></td></tr>'
+    "<tr><td>Centre-Back</td></tr></table></td>"
+    '<td class="zentriert"><a href="/c/startseite/verein/{club_id}" title="{club}"><img alt="{club}"/></a></td>'
+    '<td class="links">{injury}</td><td class="zentriert">{since}</td><td class="zentriert">{until}</td></tr>'
+)
+
+PAGE = (
+    '<html><head><meta charset="utf-8"/><title>Bundesliga - Verletzte Spieler</title>'
+    '<link rel="canonical" href="https://www.transfermarkt.com/bundesliga/verletztespieler/wettbewerb/L1"/>'
+    "</head><body><h1>Bundesliga</h1>"
+    '<table class="items"><thead><tr><th>#</th><th>Spieler</th><th>Verein</th><th>Verletzung</th>'
+    "<th>seit</th><th>bis</th></tr></thead><tbody>"
+    + ROW.format(
+        i=1, name="Jöhn Müller", club_id=3, club="1. FC Köln", injury="Knee surgery", since="Oct 11, 2025",
+        until="11.12.2025",
+    )
+    + ROW.format(
+        i=2, name="Ann Bee", club_id=27, club="Bayern Munich", injury="Hamstring", since="Sat, Oct 4, 2025",
+        until="-",
+    )
+    + ROW.format(i=3, name="No Injury", club_id=5, club="Club", injury="", since="", until="")
+    + "</tbody></table></body></html>"
+)
+
+
+def make_response(html: str, content_type: str = "text/html; charset=utf-8") -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = html.encode("utf-8")
+    response.headers["Content-Type"] = content_type
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    return response
+
+
+@pytest.fixture(autouse=True)
+def clear_results_cache():
+    league_injuries._RESULTS_CACHE.clear()
+    yield
+    league_injuries._RESULTS_CACHE.clear()
+
+
+@pytest.fixture
+def serve(monkeypatch):
+    """Serve `html` for every requests.get call; returns the list of fetched URLs."""
+    fetched = []
+
+    def _serve(html: str = PAGE, content_type: str = "text/html; charset=utf-8") -> list:
+        def fake_get(url, **kwargs):
+            fetched.append(url)
+            return make_response(html, content_type)
+
+        monkeypatch.setattr(requests, "get", fake_get)
+        return fetched
+
+    return _serve
+
+
+def test_get_league_injuries(serve):
+    fetched = serve()
+    result = TransfermarktLeagueInjuries(URL=URL).get_injuries()
+
+    assert fetched == [URL_PLUS]
+    assert result["league"] == {"name": "Bundesliga", "url": URL}
+    assert result["rows"] == [
+        {
+            "player": {
+                "id": "1",
+                "name": "Jöhn Müller Centre-Back",
+                "url": "/p/profil/spieler/1",
+                "club": {"id": "3", "name": "1. FC Köln"},
+            },
+            "injury": "Knee surgery",
+            "since": "2025-10-11",
+            "until": "2025-12-11",
+        },
+        {
+            "player": {
+                "id": "2",
+                "name": "Ann Bee Centre-Back",
+                "url": "/p/profil/spieler/2",
+                "club": {"id": "27", "name": "Bayern Munich"},
+            },
+            "injury": "Hamstring",
+            "since": "2025-10-04",
+            "until": None,
+        },
+    ]
+
+
+def test_get_league_injuries_player_fallback_skips_anchor_without_href(serve):
+    row = (
+        '<tr><td><a class="spielprofil_tooltip">Joe</a></td><td class="links">Ankle</td>'
+        '<td><a href="/a/profil/spieler/9">Joe Real</a></td></tr>'
+    )
+    serve(
+        '<html><body><h1>League</h1><table class="items"><thead><tr><th>Player</th><th>Injury</th><th></th></tr>'
+        "</thead><tbody>" + row + "</tbody></table></body></html>",
+    )
+    rows = TransfermarktLeagueInjuries(URL=URL).get_injuries()["rows"]
+
+    assert rows == [
+        {
+            "player": {"id": "9", "name": "Joe", "url": "/a/profil/spieler/9", "club": None},
+            "injury": "Ankle",
+            "since": None,
+            "until": None,
+        },
+    ]
+
+
+def test_get_league_injuries_club_link_without_name(serve):
+    row = (
+        '<tr><td><a href="/a/profil/spieler/9">Joe</a></td><td><a href="/c/startseite/verein/3"><img/></a></td>'
+        '<td class="links">Ankle</td></tr>'
+    )
+    serve(
+        '<html><body><h1>League</h1><table class="items"><thead><tr><th>Player</th><th>Club</th><th>Injury</th>'
+        "</tr></thead><tbody>" + row + "</tbody></table></body></html>",
+    )
+    rows = TransfermarktLeagueInjuries(URL=URL).get_injuries()["rows"]
+
+    assert rows[0]["player"]["club"] == {"id": "3", "name": ""}
+
+
+def test_get_league_injuries_cache_hit_skips_fetch(serve):
+    fetched = serve()
+    first = TransfermarktLeagueInjuries(URL=URL).get_injuries()
+    second = TransfermarktLeagueInjuries(URL=URL).get_injuries()
+    third = TransfermarktLeagueInjuries(URL=URL_PLUS).get_injuries()
+
+    assert fetched == [URL_PLUS]
+    assert first == second == third
+
+
+def test_get_league_injuries_cache_survives_caller_mutation(serve):
+    serve()
+    first = TransfermarktLeagueInjuries(URL=URL).get_injuries()
+    expected_rows = [dict(row, player=dict(row["player"])) for row in first["rows"]]
+    first["rows"][0]["player"]["name"] = "Changed"
+    first["rows"].clear()
+    first["league"]["name"] = "Changed"
+
+    second = TransfermarktLeagueInjuries(URL=URL).get_injuries()
+
+    assert second["league"]["name"] == "Bundesliga"
+    assert second["rows"] == expected_rows
+    assert second["updatedAt"] == first["updatedAt"]
+
+
+def test_get_league_injuries_cache_expires(serve, monkeypatch):
+    fetched = serve()
+    monkeypatch.setattr(league_injuries, "_CACHE_TTL_SECONDS", -1)
+    TransfermarktLeagueInjuries(URL=URL).get_injuries()
+    TransfermarktLeagueInjuries(URL=URL).get_injuries()
+
+    assert fetched == [URL_PLUS, URL_PLUS]
+
+
+def test_get_league_injuries_cache_evicts_least_recently_used(serve, monkeypatch):
+    fetched = serve()
+    monkeypatch.setattr(league_injuries, "_CACHE_MAXSIZE", 2)
+    urls = [f"https://www.transfermarkt.com/league-{i}/verletztespieler/wettbewerb/X{i}/plus/1" for i in range(3)]
+    for url in urls:
+        TransfermarktLeagueInjuries(URL=url).get_injuries()
+
+    assert list(league_injuries._RESULTS_CACHE) == urls[1:]
+
+    TransfermarktLeagueInjuries(URL=urls[2]).get_injuries()
+    TransfermarktLeagueInjuries(URL=urls[0]).get_injuries()
+
+    assert fetched == urls + [urls[0]]
+
+
+@pytest.mark.parametrize("content_type", ["text/html; charset=utf-8", "text/html"])
+def test_get_league_injuries_streaming_matches_dom(serve, monkeypatch, content_type):
+    serve(content_type=content_type)
+    dom = TransfermarktLeagueInjuries(URL=URL).get_injuries()
+
+    league_injuries._RESULTS_CACHE.clear()
+    monkeypatch.setattr(league_injuries, "_STREAMING_THRESHOLD_BYTES", 0)
+    tfmkt = TransfermarktLeagueInjuries(URL=URL)
+    streamed = tfmkt.get_injuries()
+
+    assert tfmkt.page is None
+    assert streamed["league"] == dom["league"]
+    assert streamed["rows"] == dom["rows"]
+    assert streamed["rows"][0]["player"]["name"] == "Jöhn Müller Centre-Back"
+
+
+def test_get_league_injuries_streaming_without_table_falls_back(serve, monkeypatch):
+    fetched = serve("<html><head><title>Not found</title></head><body><p>Nothing here</p></body></html>")
+    monkeypatch.setattr(league_injuries, "_STREAMING_THRESHOLD_BYTES", 0)
+
+    with pytest.raises(HTTPException):
+        TransfermarktLeagueInjuries(URL=URL)
+
+    assert fetched == [URL_PLUS, URL]
+
+
+def test_get_league_injuries_streaming_skips_items_table_without_th(serve, monkeypatch):
+    decoy = '<table class="items"><thead><tr><td>Filter</td></tr></thead><tbody><tr><td>x</td></tr></tbody></table>'
+    serve(PAGE.replace("<h1>Bundesliga</h1>", "<h1>Bundesliga</h1>" + decoy))
+    dom = TransfermarktLeagueInjuries(URL=URL).get_injuries()
+
+    league_injuries._RESULTS_CACHE.clear()
+    monkeypatch.setattr(league_injuries, "_STREAMING_THRESHOLD_BYTES", 0)
+    streamed = TransfermarktLeagueInjuries(URL=URL).get_injuries()
+
+    assert len(dom["rows"]) == 2
+    assert streamed["rows"] == dom["rows"]
+
+
+@pytest.mark.parametrize(
+    "heading,expected",
+    [
+        ("<h1>Bundesliga</h1>", "Bundesliga"),
+        ('<nav><ol><li><a href="/">Home</a></li><li><a href="/l1">Crumb</a></li></ol></nav>', "Crumb"),
+        ("", "Bundesliga - Verletzte Spieler"),
+    ],
+)
+def test_get_league_injuries_streaming_league_name_matches_dom(serve, monkeypatch, heading, expected):
+    serve(PAGE.replace("<h1>Bundesliga</h1>", heading))
+    dom = TransfermarktLeagueInjuries(URL=URL).get_injuries()
+
+    league_injuries._RESULTS_CACHE.clear()
+    monkeypatch.setattr(league_injuries, "_STREAMING_THRESHOLD_BYTES", 0)
+    streamed = TransfermarktLeagueInjuries(URL=URL).get_injuries()
+
+    assert dom["league"]["name"] == streamed["league"]["name"] == expected
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("2025-10-11", "2025-10-11"),
+        ("11.10.2025", "2025-10-11"),
+        ("01/09/2025", "2025-09-01"),
+        ("1/9/25", "2025-09-01"),
+        ("1/9/75", "1975-09-01"),
+        ("Oct 11, 2025", "2025-10-11"),
+        ("Sat, Oct 11, 2025", "2025-10-11"),
+        ("Oct 11 2025", "2025-10-11"),
+        ("Feb 29, 2024", "2024-02-29"),
+        ("Feb 29, 2023", None),
+        ("Oct 32, 2025", None),
+        ("Oct 11, ２０２５", None),
+        ("２０２５-10-11", None),
+        ("2025-10-11x", None),
+        ("unknown", None),
+        ("-", None),
+        ("?", None),
+        ("", None),
+        (None, None),
+    ],
+)
+def test_normalize_date(serve, value, expected):
+    serve()
+    assert TransfermarktLeagueInjuries(URL=URL)._normalize_date(value) == expected